@@ -14,14 +14,16 @@ Supports:
 import argparse
 import asyncio
 import json
-import random
+import multiprocessing
+import os
 import signal
-import string
 import sys
 import time
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
-from typing import Optional
+import traceback
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from queue import Empty
+from typing import Callable, Optional
 
 try:
     import nats
@@ -31,12 +33,32 @@ except ImportError:
     print("Error: nats-py is required. Install with: pip install nats-py")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    print("Error: orjson is required. Install with: pip install orjson")
+    sys.exit(1)
+
+try:
+    import msgpack
+except ImportError:
+    print("Error: msgpack is required. Install with: pip install msgpack")
+    sys.exit(1)
+
+try:
+    import uvloop
+except ImportError:
+    # Optional; the stdlib event loop is used when unavailable
+    uvloop = None
+
 
 @dataclass
 class Config:
     """Configuration for the test publisher tool."""
 
     nats_url: str = "nats://localhost:4222"
+    workers: int = 1
+    connections: int = 1
 
     # Normal publishers
     normal_publishers: int = 0
@@ -48,6 +70,7 @@ class Config:
     js_subject_prefix: str = "test.js"
     js_stream_name: str = "TEST"
     js_interval_ms: int = 1000
+    js_batch_size: int = 1
 
     # Request-Reply publishers
     reqrep_publishers: int = 0
@@ -72,51 +95,60 @@ class Config:
     message_size_bytes: int = 128
     include_timestamp: bool = True
     include_sequence: bool = True
+    binary_payload: bool = False
 
     # Output options
     verbose: bool = False
-    stats_interval_sec: int = 5
+    stats_interval_sec: float = 5
+
+
+PUBLISHER_KINDS = ("normal", "js", "reqrep", "kv", "obj")
+
+
+@dataclass
+class LocalStats:
+    """Counters owned by a single publisher task."""
+
+    sent: int = 0
+    errors: int = 0
 
 
 @dataclass
 class Stats:
-    """Tracks publishing statistics."""
-
-    normal_sent: int = 0
-    normal_errors: int = 0
-    js_sent: int = 0
-    js_errors: int = 0
-    reqrep_sent: int = 0
-    reqrep_errors: int = 0
-    kv_sent: int = 0
-    kv_errors: int = 0
-    obj_sent: int = 0
-    obj_errors: int = 0
+    """Tracks publishing statistics, summed from per-task LocalStats."""
+
+    normal: list[LocalStats] = field(default_factory=list)
+    js: list[LocalStats] = field(default_factory=list)
+    reqrep: list[LocalStats] = field(default_factory=list)
+    kv: list[LocalStats] = field(default_factory=list)
+    obj: list[LocalStats] = field(default_factory=list)
     start_time: float = field(default_factory=time.time)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
-    async def increment(self, stat_name: str, amount: int = 1):
-        async with self._lock:
-            current = getattr(self, stat_name)
-            setattr(self, stat_name, current + amount)
+    def register(self, kind: str) -> LocalStats:
+        """Create and track the counters for a new publisher of a kind."""
+        local = LocalStats()
+        getattr(self, kind).append(local)
+        return local
+
+    def sent(self, kind: str) -> int:
+        return sum(s.sent for s in getattr(self, kind))
+
+    def errors(self, kind: str) -> int:
+        return sum(s.errors for s in getattr(self, kind))
+
+    def sent_counts(self) -> tuple[int, ...]:
+        """Snapshot the sent count of every kind, in PUBLISHER_KINDS order."""
+        return tuple(self.sent(kind) for kind in PUBLISHER_KINDS)
+
+    def error_counts(self) -> tuple[int, ...]:
+        """Snapshot the error count of every kind, in PUBLISHER_KINDS order."""
+        return tuple(self.errors(kind) for kind in PUBLISHER_KINDS)
 
     def total_sent(self) -> int:
-        return (
-            self.normal_sent
-            + self.js_sent
-            + self.reqrep_sent
-            + self.kv_sent
-            + self.obj_sent
-        )
+        return sum(self.sent(kind) for kind in PUBLISHER_KINDS)
 
     def total_errors(self) -> int:
-        return (
-            self.normal_errors
-            + self.js_errors
-            + self.reqrep_errors
-            + self.kv_errors
-            + self.obj_errors
-        )
+        return sum(self.errors(kind) for kind in PUBLISHER_KINDS)
 
     def rate(self) -> float:
         elapsed = time.time() - self.start_time
@@ -126,192 +158,376 @@ class Stats:
 
 
 def random_string(length: int) -> str:
-    """Generate a random alphanumeric string."""
-    return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+    """Generate a random hex string."""
+    return os.urandom((length + 1) // 2).hex()[:length]
 
 
-def create_message(
+@lru_cache(maxsize=None)
+def shared_data(length: int) -> str:
+    """Return the random hex data shared by every message of a length."""
+    return random_string(length)
+
+
+@lru_cache(maxsize=None)
+def shared_object_data(size: int) -> bytes:
+    """Return the random bytes shared by every object of a size."""
+    return os.urandom(size)
+
+
+@lru_cache(maxsize=1)
+def _timestamp_prefix(seconds: int) -> bytes:
+    """Format a UTC time up to the fractional second, e.g. 2024-01-02T03:04:05."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(seconds)).encode()
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds."""
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{_timestamp_prefix(seconds).decode()}{micros:06d}Z"
+
+
+def build_message(
     publisher_id: int, publisher_type: str, sequence: int, config: Config
-) -> bytes:
-    """Create a JSON message payload."""
+) -> dict:
+    """Build the fields of a message before serialization."""
     msg = {
         "publisher_id": publisher_id,
         "publisher_type": publisher_type,
-        "data": random_string(config.message_size_bytes),
+        "data": shared_data(config.message_size_bytes),
     }
     if config.include_sequence:
         msg["sequence"] = sequence
     if config.include_timestamp:
-        msg["timestamp"] = datetime.utcnow().isoformat() + "Z"
-    return json.dumps(msg).encode()
+        msg["timestamp"] = utc_timestamp()
+    return msg
 
 
-async def run_normal_publisher(
-    nc: nats.NATS,
+def create_message(
+    publisher_id: int, publisher_type: str, sequence: int, config: Config
+) -> bytes:
+    """Create a JSON message payload."""
+    return orjson.dumps(build_message(publisher_id, publisher_type, sequence, config))
+
+
+def create_message_msgpack(
+    publisher_id: int, publisher_type: str, sequence: int, config: Config
+) -> bytes:
+    """Create a MessagePack message payload."""
+    return msgpack.packb(
+        build_message(publisher_id, publisher_type, sequence, config),
+        use_bin_type=True,
+    )
+
+
+def message_encoder(
     publisher_id: int,
+    publisher_type: str,
     config: Config,
-    stats: Stats,
+    create: Callable[[int, str, int, Config], bytes] = create_message,
+) -> Callable[[int], bytes]:
+    """Return a function that renders a publisher's message for a sequence."""
+    if not config.include_sequence and not config.include_timestamp:
+        cached = create(publisher_id, publisher_type, 0, config)
+        return lambda sequence: cached
+
+    if create is not create_message:
+        return lambda sequence: create(publisher_id, publisher_type, sequence, config)
+
+    # Drop the closing brace so per-message fields can be appended
+    template = orjson.dumps(
+        {
+            "publisher_id": publisher_id,
+            "publisher_type": publisher_type,
+            "data": shared_data(config.message_size_bytes),
+        }
+    )[:-1].replace(b"%", b"%%")
+    if config.include_sequence:
+        template += b',"sequence":%d'
+    if config.include_timestamp:
+        template += b',"timestamp":"%b%06dZ"'
+    template += b"}"
+
+    time_ns = time.time_ns
+    if not config.include_timestamp:
+        return lambda sequence: template % sequence
+
+    if not config.include_sequence:
+
+        def encode(sequence: int) -> bytes:
+            seconds, micros = divmod(time_ns() // 1000, 1_000_000)
+            return template % (_timestamp_prefix(seconds), micros)
+
+        return encode
+
+    def encode(sequence: int) -> bytes:
+        seconds, micros = divmod(time_ns() // 1000, 1_000_000)
+        return template % (sequence, _timestamp_prefix(seconds), micros)
+
+    return encode
+
+
+def publisher_name(prefix: str, separator: str, publisher_id: int) -> str:
+    """Build a publisher's subject, key or object name."""
+    return sys.intern(f"{prefix}{separator}{publisher_id}")
+
+
+async def sleep_until(loop: asyncio.AbstractEventLoop, deadline: float) -> float:
+    """Sleep until a loop-clock deadline and return the deadline reached."""
+    delay = deadline - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+        return deadline
+    await asyncio.sleep(0)
+    return loop.time()
+
+
+async def run_normal_fleet(
+    nc: nats.NATS,
+    publisher_ids: range,
+    config: Config,
+    stats: list[LocalStats],
     stop_event: asyncio.Event,
 ):
-    """Run a normal (core NATS) publisher."""
-    subject = f"{config.normal_subject_prefix}.{publisher_id}"
+    """Run all normal (core NATS) publishers from a single task."""
+    subjects = [
+        publisher_name(config.normal_subject_prefix, ".", i) for i in publisher_ids
+    ]
+    encoders = [message_encoder(i, "normal", config) for i in publisher_ids]
+    publishers = list(zip(publisher_ids, subjects, encoders, stats))
     interval = config.normal_interval_ms / 1000.0
     sequence = 0
 
     if config.verbose:
-        print(
-            f"[Normal-{publisher_id}] Started publishing to {subject} every {config.normal_interval_ms}ms"
-        )
+        for publisher_id, subject in zip(publisher_ids, subjects):
+            print(
+                f"[Normal-{publisher_id}] Started publishing to {subject} every {config.normal_interval_ms}ms"
+            )
 
-    while not stop_event.is_set():
-        try:
-            sequence += 1
-            msg = create_message(publisher_id, "normal", sequence, config)
-            await nc.publish(subject, msg)
-            await stats.increment("normal_sent")
+    # Bind hot lookups once rather than on every iteration
+    publish = nc.publish
+    is_set = stop_event.is_set
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
 
-            if config.verbose:
+    # Pick the loop variant once so the quiet path never checks verbose
+    if not config.verbose:
+        while not is_set():
+            sequence += 1
+            for _, subject, encode, local in publishers:
+                try:
+                    await publish(subject, encode(sequence))
+                    local.sent += 1
+                except Exception:
+                    local.errors += 1
+
+            try:
+                deadline = await sleep_until(loop, deadline + interval)
+            except asyncio.CancelledError:
+                break
+        return
+
+    while not is_set():
+        sequence += 1
+        for publisher_id, subject, encode, local in publishers:
+            try:
+                await publish(subject, encode(sequence))
+                local.sent += 1
                 print(f"[Normal-{publisher_id}] Published seq {sequence} to {subject}")
-        except Exception as e:
-            await stats.increment("normal_errors")
-            if config.verbose:
+            except Exception as e:
+                local.errors += 1
                 print(f"[Normal-{publisher_id}] Error: {e}")
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            deadline = await sleep_until(loop, deadline + interval)
+        except asyncio.CancelledError:
             break
-        except asyncio.TimeoutError:
-            pass
 
 
-async def run_js_publisher(
+async def run_js_fleet(
     js: nats.js.JetStreamContext,
-    publisher_id: int,
+    publisher_ids: range,
     config: Config,
-    stats: Stats,
+    stats: list[LocalStats],
     stop_event: asyncio.Event,
 ):
-    """Run a JetStream publisher."""
-    subject = f"{config.js_subject_prefix}.{publisher_id}"
+    """Run all JetStream publishers from a single task."""
+    subjects = [publisher_name(config.js_subject_prefix, ".", i) for i in publisher_ids]
+    encoders = [message_encoder(i, "jetstream", config) for i in publisher_ids]
+    publishers = list(zip(publisher_ids, subjects, encoders, stats))
     interval = config.js_interval_ms / 1000.0
+    batch_size = max(config.js_batch_size, 1)
     sequence = 0
 
     if config.verbose:
-        print(
-            f"[JS-{publisher_id}] Started publishing to {subject} every {config.js_interval_ms}ms"
-        )
+        for publisher_id, subject in zip(publisher_ids, subjects):
+            print(
+                f"[JS-{publisher_id}] Started publishing batches of {batch_size} to {subject} every {config.js_interval_ms}ms"
+            )
 
-    while not stop_event.is_set():
-        try:
-            sequence += 1
-            msg = create_message(publisher_id, "jetstream", sequence, config)
-            await js.publish(subject, msg)
-            await stats.increment("js_sent")
+    publish = js.publish
+    is_set = stop_event.is_set
+    gather = asyncio.gather
+    batch_range = range(1, batch_size + 1)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+
+    # Pick the loop variant once so the quiet path never checks verbose
+    if not config.verbose:
+        while not is_set():
+            # Issue every batch before waiting on any acks
+            results = await gather(
+                *(
+                    publish(subject, encode(sequence + n))
+                    for _, subject, encode, _ in publishers
+                    for n in batch_range
+                ),
+                return_exceptions=True,
+            )
+            sequence += batch_size
+
+            for i, (_, _, _, local) in enumerate(publishers):
+                batch = results[i * batch_size : (i + 1) * batch_size]
+                failed = sum(isinstance(result, Exception) for result in batch)
+                local.sent += batch_size - failed
+                local.errors += failed
+
+            try:
+                deadline = await sleep_until(loop, deadline + interval)
+            except asyncio.CancelledError:
+                break
+        return
+
+    while not is_set():
+        results = await gather(
+            *(
+                publish(subject, encode(sequence + n))
+                for _, subject, encode, _ in publishers
+                for n in batch_range
+            ),
+            return_exceptions=True,
+        )
+        sequence += batch_size
 
-            if config.verbose:
-                print(f"[JS-{publisher_id}] Published seq {sequence} to {subject}")
-        except Exception as e:
-            await stats.increment("js_errors")
-            if config.verbose:
-                print(f"[JS-{publisher_id}] Error: {e}")
+        for i, (publisher_id, subject, _, local) in enumerate(publishers):
+            for result in results[i * batch_size : (i + 1) * batch_size]:
+                if isinstance(result, Exception):
+                    local.errors += 1
+                    print(f"[JS-{publisher_id}] Error: {result}")
+                else:
+                    local.sent += 1
+            print(f"[JS-{publisher_id}] Published up to seq {sequence} to {subject}")
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            deadline = await sleep_until(loop, deadline + interval)
+        except asyncio.CancelledError:
             break
-        except asyncio.TimeoutError:
-            pass
 
 
 async def run_reqrep_publisher(
     nc: nats.NATS,
     publisher_id: int,
     config: Config,
-    stats: Stats,
+    stats: LocalStats,
     stop_event: asyncio.Event,
 ):
     """Run a request-reply publisher."""
-    subject = f"{config.reqrep_subject_prefix}.{publisher_id}"
+    subject = publisher_name(config.reqrep_subject_prefix, ".", publisher_id)
     interval = config.reqrep_interval_ms / 1000.0
     timeout = config.reqrep_timeout_ms / 1000.0
     sequence = 0
+    encode = message_encoder(publisher_id, "request-reply", config)
 
     if config.verbose:
         print(
             f"[ReqRep-{publisher_id}] Started requesting to {subject} every {config.reqrep_interval_ms}ms"
         )
 
-    while not stop_event.is_set():
+    request = nc.request
+    is_set = stop_event.is_set
+    verbose = config.verbose
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while not is_set():
         try:
             sequence += 1
-            msg = create_message(publisher_id, "request-reply", sequence, config)
-            await nc.request(subject, msg, timeout=timeout)
-            await stats.increment("reqrep_sent")
+            msg = encode(sequence)
+            await request(subject, msg, timeout=timeout)
+            stats.sent += 1
 
-            if config.verbose:
+            if verbose:
                 print(f"[ReqRep-{publisher_id}] Request seq {sequence} got reply")
         except NatsTimeoutError:
-            await stats.increment("reqrep_errors")
-            if config.verbose:
+            stats.errors += 1
+            if verbose:
                 print(f"[ReqRep-{publisher_id}] Timeout (no responder?)")
         except Exception as e:
-            await stats.increment("reqrep_errors")
-            if config.verbose:
+            stats.errors += 1
+            if verbose:
                 print(f"[ReqRep-{publisher_id}] Error: {e}")
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            deadline = await sleep_until(loop, deadline + interval)
+        except asyncio.CancelledError:
             break
-        except asyncio.TimeoutError:
-            pass
 
 
 async def run_kv_publisher(
     kv: nats.js.kv.KeyValue,
     publisher_id: int,
     config: Config,
-    stats: Stats,
+    stats: LocalStats,
     stop_event: asyncio.Event,
 ):
     """Run a Key-Value publisher."""
-    key = f"{config.kv_key_prefix}-{publisher_id}"
+    key = publisher_name(config.kv_key_prefix, "-", publisher_id)
     interval = config.kv_interval_ms / 1000.0
     sequence = 0
+    encode = message_encoder(
+        publisher_id,
+        "kv",
+        config,
+        create_message_msgpack if config.binary_payload else create_message,
+    )
 
     if config.verbose:
         print(
             f"[KV-{publisher_id}] Started putting to key {key} every {config.kv_interval_ms}ms"
         )
 
-    while not stop_event.is_set():
+    put = kv.put
+    is_set = stop_event.is_set
+    verbose = config.verbose
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while not is_set():
         try:
             sequence += 1
-            msg = create_message(publisher_id, "kv", sequence, config)
-            await kv.put(key, msg)
-            await stats.increment("kv_sent")
+            msg = encode(sequence)
+            await put(key, msg)
+            stats.sent += 1
 
-            if config.verbose:
+            if verbose:
                 print(f"[KV-{publisher_id}] Put seq {sequence} to key {key}")
         except Exception as e:
-            await stats.increment("kv_errors")
-            if config.verbose:
+            stats.errors += 1
+            if verbose:
                 print(f"[KV-{publisher_id}] Error: {e}")
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            deadline = await sleep_until(loop, deadline + interval)
+        except asyncio.CancelledError:
             break
-        except asyncio.TimeoutError:
-            pass
 
 
 async def run_obj_publisher(
     obs: nats.js.object_store.ObjectStore,
     publisher_id: int,
     config: Config,
-    stats: Stats,
+    stats: LocalStats,
     stop_event: asyncio.Event,
 ):
     """Run an Object Store publisher."""
-    obj_name = f"{config.obj_name_prefix}-{publisher_id}"
+    obj_name = publisher_name(config.obj_name_prefix, "-", publisher_id)
     interval = config.obj_interval_ms / 1000.0
     sequence = 0
 
@@ -320,41 +536,52 @@ async def run_obj_publisher(
             f"[Obj-{publisher_id}] Started putting object {obj_name} every {config.obj_interval_ms}ms"
         )
 
-    while not stop_event.is_set():
+    put = obs.put
+    size = config.obj_size_bytes
+    data = shared_object_data(size)
+    is_set = stop_event.is_set
+    verbose = config.verbose
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while not is_set():
         try:
             sequence += 1
-            data = random_string(config.obj_size_bytes).encode()
-            await obs.put(obj_name, data)
-            await stats.increment("obj_sent")
+            await put(obj_name, data)
+            stats.sent += 1
 
-            if config.verbose:
+            if verbose:
                 print(
-                    f"[Obj-{publisher_id}] Put object {obj_name} seq {sequence} ({config.obj_size_bytes} bytes)"
+                    f"[Obj-{publisher_id}] Put object {obj_name} seq {sequence} ({size} bytes)"
                 )
         except Exception as e:
-            await stats.increment("obj_errors")
-            if config.verbose:
+            stats.errors += 1
+            if verbose:
                 print(f"[Obj-{publisher_id}] Error: {e}")
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            deadline = await sleep_until(loop, deadline + interval)
+        except asyncio.CancelledError:
             break
-        except asyncio.TimeoutError:
-            pass
+
+
+STATS_LINE = (
+    "Stats: Normal=%d JS=%d ReqRep=%d KV=%d Obj=%d | Total=%d | Rate=%.1f msg/s\n"
+)
 
 
 async def stats_reporter(stats: Stats, config: Config, stop_event: asyncio.Event):
     """Periodically report statistics."""
+    write = sys.stdout.write
     while not stop_event.is_set():
         try:
             await asyncio.wait_for(stop_event.wait(), timeout=config.stats_interval_sec)
             break
         except asyncio.TimeoutError:
-            print(
-                f"Stats: Normal={stats.normal_sent} JS={stats.js_sent} "
-                f"ReqRep={stats.reqrep_sent} KV={stats.kv_sent} Obj={stats.obj_sent} | "
-                f"Total={stats.total_sent()} | Rate={stats.rate():.1f} msg/s"
-            )
+            counts = stats.sent_counts()
+            total = sum(counts)
+            elapsed = time.time() - stats.start_time
+            rate = total / elapsed if elapsed > 0 else 0.0
+            write(STATS_LINE % (*counts, total, rate))
 
 
 def print_final_stats(stats: Stats):
@@ -367,11 +594,15 @@ def print_final_stats(stats: Stats):
     print(f"Runtime: {elapsed:.1f} seconds\n")
 
     print("Messages Sent:")
-    print(f"  Normal:        {stats.normal_sent:>8} (errors: {stats.normal_errors})")
-    print(f"  JetStream:     {stats.js_sent:>8} (errors: {stats.js_errors})")
-    print(f"  Request-Reply: {stats.reqrep_sent:>8} (errors: {stats.reqrep_errors})")
-    print(f"  Key-Value:     {stats.kv_sent:>8} (errors: {stats.kv_errors})")
-    print(f"  Object Store:  {stats.obj_sent:>8} (errors: {stats.obj_errors})")
+    print(
+        f"  Normal:        {stats.sent('normal'):>8} (errors: {stats.errors('normal')})"
+    )
+    print(f"  JetStream:     {stats.sent('js'):>8} (errors: {stats.errors('js')})")
+    print(
+        f"  Request-Reply: {stats.sent('reqrep'):>8} (errors: {stats.errors('reqrep')})"
+    )
+    print(f"  Key-Value:     {stats.sent('kv'):>8} (errors: {stats.errors('kv')})")
+    print(f"  Object Store:  {stats.sent('obj'):>8} (errors: {stats.errors('obj')})")
     print()
     print(f"Total: {stats.total_sent()} messages (errors: {stats.total_errors()})")
     print(f"Average Rate: {stats.rate():.2f} msg/s")
@@ -423,6 +654,441 @@ async def ensure_object_store(js: nats.js.JetStreamContext, bucket: str):
         return None
 
 
+async def bind_kv_bucket(js: nats.js.JetStreamContext, bucket: str):
+    """Look up an existing KV bucket."""
+    try:
+        return await js.key_value(bucket)
+    except Exception as e:
+        print(f"Warning: Could not bind KV bucket {bucket}: {e}")
+        return None
+
+
+async def bind_object_store(js: nats.js.JetStreamContext, bucket: str):
+    """Look up an existing Object Store bucket."""
+    try:
+        return await js.object_store(bucket)
+    except Exception as e:
+        print(f"Warning: Could not bind Object Store bucket {bucket}: {e}")
+        return None
+
+
+def uses_jetstream(config: Config) -> bool:
+    """Return whether any configured publisher needs JetStream."""
+    return (
+        config.js_publishers > 0
+        or config.kv_publishers > 0
+        or config.obj_publishers > 0
+    )
+
+
+async def ensure_jetstream(nc: nats.NATS, config: Config):
+    """Ensure the stream and buckets the configured publishers need."""
+    js = nc.jetstream()
+    print("JetStream context created")
+    if config.js_publishers > 0:
+        await ensure_stream(js, config.js_stream_name, config.js_subject_prefix)
+    if config.kv_publishers > 0:
+        await ensure_kv_bucket(js, config.kv_bucket)
+    if config.obj_publishers > 0:
+        await ensure_object_store(js, config.obj_bucket)
+
+
+async def connect(config: Config) -> nats.NATS:
+    """Open a connection to the configured NATS server."""
+    return await nats.connect(
+        config.nats_url,
+        name="nats-test-publisher",
+        reconnect_time_wait=1,
+        max_reconnect_attempts=-1,
+    )
+
+
+async def connect_all(config: Config) -> list[nats.NATS]:
+    """Open the configured number of connections to the NATS server."""
+    conns = []
+    try:
+        for _ in range(max(config.connections, 1)):
+            conns.append(await connect(config))
+    except Exception:
+        await close_all(conns)
+        raise
+    return conns
+
+
+async def close_all(conns: list[nats.NATS]):
+    """Close every connection, ignoring individual close failures."""
+    await asyncio.gather(*(nc.close() for nc in conns), return_exceptions=True)
+
+
+async def start_publishers(
+    conns: list[nats.NATS],
+    config: Config,
+    stats: Stats,
+    stop_event: asyncio.Event,
+    first_ids: Optional[dict[str, int]] = None,
+    ensure: bool = True,
+) -> list[asyncio.Task]:
+    """Create a task for every publisher, ensuring or binding streams/buckets."""
+    first_ids = first_ids or {}
+
+    def shards(kind: str) -> list[range]:
+        """Split a kind's publisher ids into one slice per connection."""
+        first = first_ids.get(kind, 0)
+        ids = range(first, first + getattr(config, f"{kind}_publishers"))
+        return [ids[k :: len(conns)] for k in range(len(conns))]
+
+    # Get JetStream contexts if needed
+    jss = []
+    if uses_jetstream(config):
+        jss = [nc.jetstream() for nc in conns]
+        if ensure:
+            print("JetStream context created")
+
+    # Collect all publisher tasks
+    tasks = []
+
+    # Normal publishers
+    if config.normal_publishers > 0:
+        for k, (nc, normal_ids) in enumerate(zip(conns, shards("normal"))):
+            if not normal_ids:
+                continue
+            tasks.append(
+                asyncio.create_task(
+                    run_normal_fleet(
+                        nc,
+                        normal_ids,
+                        config,
+                        [stats.register("normal") for _ in normal_ids],
+                        stop_event,
+                    ),
+                    name=f"normal-fleet-{k}",
+                )
+            )
+
+    # JetStream publishers
+    if config.js_publishers > 0:
+        if ensure:
+            await ensure_stream(jss[0], config.js_stream_name, config.js_subject_prefix)
+        for k, (js, js_ids) in enumerate(zip(jss, shards("js"))):
+            if not js_ids:
+                continue
+            tasks.append(
+                asyncio.create_task(
+                    run_js_fleet(
+                        js,
+                        js_ids,
+                        config,
+                        [stats.register("js") for _ in js_ids],
+                        stop_event,
+                    ),
+                    name=f"js-fleet-{k}",
+                )
+            )
+
+    # Request-Reply publishers
+    for nc, reqrep_ids in zip(conns, shards("reqrep")):
+        for i in reqrep_ids:
+            tasks.append(
+                asyncio.create_task(
+                    run_reqrep_publisher(
+                        nc, i, config, stats.register("reqrep"), stop_event
+                    ),
+                    name=f"reqrep-{i}",
+                )
+            )
+
+    # KV publishers
+    if config.kv_publishers > 0:
+        if ensure:
+            kv = await ensure_kv_bucket(jss[0], config.kv_bucket)
+        else:
+            kv = await bind_kv_bucket(jss[0], config.kv_bucket)
+        if kv:
+            for k, (js, kv_ids) in enumerate(zip(jss, shards("kv"))):
+                if not kv_ids:
+                    continue
+                # Bind the bucket to this shard's own connection
+                bucket = kv if k == 0 else await bind_kv_bucket(js, config.kv_bucket)
+                for i in kv_ids:
+                    tasks.append(
+                        asyncio.create_task(
+                            run_kv_publisher(
+                                bucket, i, config, stats.register("kv"), stop_event
+                            ),
+                            name=f"kv-{i}",
+                        )
+                    )
+
+    # Object Store publishers
+    if config.obj_publishers > 0:
+        if ensure:
+            obs = await ensure_object_store(jss[0], config.obj_bucket)
+        else:
+            obs = await bind_object_store(jss[0], config.obj_bucket)
+        if obs:
+            for k, (js, obj_ids) in enumerate(zip(jss, shards("obj"))):
+                if not obj_ids:
+                    continue
+                store = (
+                    obs if k == 0 else await bind_object_store(js, config.obj_bucket)
+                )
+                for i in obj_ids:
+                    tasks.append(
+                        asyncio.create_task(
+                            run_obj_publisher(
+                                store, i, config, stats.register("obj"), stop_event
+                            ),
+                            name=f"obj-{i}",
+                        )
+                    )
+
+    return tasks
+
+
+async def wait_for_tasks(tasks: list[asyncio.Task], stop_event: asyncio.Event) -> bool:
+    """Wait for every task to finish and return whether any of them failed."""
+    if not tasks:
+        return False
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    if pending:
+        stop_event.set()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    failed = False
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            failed = True
+            print(f"Error: {task.get_name()} failed:", file=sys.stderr)
+            traceback.print_exception(task.exception())
+    return failed
+
+
+def shard_config(
+    config: Config, index: int, workers: int
+) -> tuple[Config, dict[str, int]]:
+    """Return a worker's share of the publishers and its first id per kind."""
+    counts = {}
+    first_ids = {}
+    for kind in PUBLISHER_KINDS:
+        base, extra = divmod(getattr(config, f"{kind}_publishers"), workers)
+        counts[f"{kind}_publishers"] = base + (1 if index < extra else 0)
+        first_ids[kind] = index * base + min(index, extra)
+    return replace(config, workers=1, **counts), first_ids
+
+
+# States a worker reports to the parent along with its counters
+WORKER_CONNECTED = "connected"
+WORKER_CONNECT_FAILED = "connect-failed"
+WORKER_RUNNING = "running"
+WORKER_DONE = "done"
+WORKER_FAILED = "failed"
+
+
+def report_state(
+    queue: multiprocessing.Queue, index: int, state: str, stats: Stats, error: str = ""
+):
+    """Send a worker's state and counters to the parent process."""
+    queue.put((index, state, stats.sent_counts(), stats.error_counts(), error))
+
+
+async def report_to_parent(
+    stats: Stats,
+    config: Config,
+    index: int,
+    queue: multiprocessing.Queue,
+    stop_event: asyncio.Event,
+):
+    """Periodically send a worker's counters to the parent process."""
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=config.stats_interval_sec)
+            break
+        except asyncio.TimeoutError:
+            report_state(queue, index, WORKER_RUNNING, stats)
+
+
+async def run_worker(
+    config: Config, first_ids: dict[str, int], index: int, queue: multiprocessing.Queue
+) -> bool:
+    """Run one shard of the publishers and return whether it failed."""
+    stats = Stats()
+    try:
+        conns = await connect_all(config)
+    except Exception as e:
+        report_state(queue, index, WORKER_CONNECT_FAILED, stats, str(e))
+        return True
+
+    report_state(queue, index, WORKER_CONNECTED, stats)
+
+    stop_event = asyncio.Event()
+    tasks: list[asyncio.Task] = []
+
+    def signal_handler():
+        stop_event.set()
+        for task in tasks:
+            task.cancel()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler)
+
+    tasks.extend(
+        await start_publishers(
+            conns, config, stats, stop_event, first_ids, ensure=False
+        )
+    )
+    if config.stats_interval_sec > 0:
+        tasks.append(
+            asyncio.create_task(
+                report_to_parent(stats, config, index, queue, stop_event),
+                name="report-to-parent",
+            )
+        )
+
+    failed = await wait_for_tasks(tasks, stop_event)
+    report_state(queue, index, WORKER_FAILED if failed else WORKER_DONE, stats)
+    await close_all(conns)
+    return failed
+
+
+def run_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _worker_main(
+    config: Config, first_ids: dict[str, int], index: int, queue: multiprocessing.Queue
+):
+    """Entry point of a worker process."""
+    try:
+        failed = run_event_loop(run_worker(config, first_ids, index, queue))
+    except KeyboardInterrupt:
+        failed = False
+    if failed:
+        sys.exit(1)
+
+
+async def run_workers(config: Config, total_publishers: int):
+    """Shard the publishers across worker processes and aggregate their stats."""
+    print(f"Connecting to NATS at {config.nats_url}...")
+
+    # Ensure streams and buckets once, before any worker binds to them
+    if uses_jetstream(config):
+        try:
+            nc = await connect(config)
+        except Exception as e:
+            print(f"Failed to connect to NATS: {e}")
+            sys.exit(1)
+        await ensure_jetstream(nc, config)
+        await nc.close()
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    workers = []
+    for index in range(config.workers):
+        shard, first_ids = shard_config(config, index, config.workers)
+        if not any(getattr(shard, f"{kind}_publishers") for kind in PUBLISHER_KINDS):
+            continue
+        workers.append(
+            ctx.Process(
+                target=_worker_main,
+                args=(shard, first_ids, len(workers), queue),
+                name=f"nats-test-publisher-{len(workers)}",
+            )
+        )
+
+    # Parent-side counters mirror the latest snapshot from each worker
+    stats = Stats()
+    worker_stats = [[stats.register(kind) for kind in PUBLISHER_KINDS] for _ in workers]
+
+    stop_event = asyncio.Event()
+
+    def signal_handler():
+        if stop_event.is_set():
+            return
+        print("\nShutting down...")
+        stop_event.set()
+        for worker in workers:
+            worker.terminate()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler)
+
+    print(f"Starting {total_publishers} publishers across {len(workers)} workers...")
+    for worker in workers:
+        worker.start()
+
+    reporter = None
+    started = False
+    starting = set(range(len(workers)))
+    pending = set(range(len(workers)))
+    connect_errors: dict[int, str] = {}
+    while pending:
+        try:
+            index, state, sent, errors, error = await loop.run_in_executor(
+                None, queue.get, True, 0.5
+            )
+        except Empty:
+            # Stop waiting on workers that exited without a final report
+            pending = {i for i in pending if workers[i].is_alive()}
+            starting &= pending
+        else:
+            for local, kind_sent, kind_errors in zip(worker_stats[index], sent, errors):
+                local.sent = kind_sent
+                local.errors = kind_errors
+            if state == WORKER_CONNECT_FAILED:
+                connect_errors[index] = error
+            if state != WORKER_RUNNING:
+                starting.discard(index)
+            if state in (WORKER_CONNECT_FAILED, WORKER_DONE, WORKER_FAILED):
+                pending.discard(index)
+
+        if started or starting:
+            continue
+
+        # Every worker has connected or given up
+        started = True
+        if len(connect_errors) == len(workers):
+            break
+        for index, error in connect_errors.items():
+            print(f"[Worker-{index}] Failed to connect to NATS: {error}")
+        if not stop_event.is_set():
+            print("Connected to NATS")
+            if config.stats_interval_sec > 0:
+                reporter = asyncio.create_task(
+                    stats_reporter(stats, config, stop_event)
+                )
+            print("All publishers started. Press Ctrl+C to stop.")
+
+    stop_event.set()
+    if reporter:
+        await reporter
+    for worker in workers:
+        await loop.run_in_executor(None, worker.join)
+
+    if len(connect_errors) == len(workers):
+        print(f"Failed to connect to NATS: {next(iter(connect_errors.values()))}")
+        sys.exit(1)
+
+    print_final_stats(stats)
+
+    # Workers exit non-zero when they fail to connect or a publisher crashes;
+    # SIGTERM is how the parent stops them on shutdown
+    failed = [
+        i
+        for i, worker in enumerate(workers)
+        if worker.exitcode not in (0, -signal.SIGTERM)
+    ]
+    if failed:
+        print(f"Workers failed: {', '.join(f'Worker-{i}' for i in failed)}")
+        sys.exit(1)
+
+
 async def main(config: Config):
     """Main entry point."""
     # Validate we have at least one publisher
@@ -444,38 +1110,34 @@ async def main(config: Config):
         )
         sys.exit(1)
 
+    if config.workers > 1:
+        await run_workers(config, total_publishers)
+        return
+
     # Connect to NATS
     print(f"Connecting to NATS at {config.nats_url}...")
     try:
-        nc = await nats.connect(
-            config.nats_url,
-            name="nats-test-publisher",
-            reconnect_time_wait=1,
-            max_reconnect_attempts=-1,
-        )
+        conns = await connect_all(config)
     except Exception as e:
         print(f"Failed to connect to NATS: {e}")
         sys.exit(1)
 
-    print("Connected to NATS")
-
-    # Get JetStream context if needed
-    js = None
-    if (
-        config.js_publishers > 0
-        or config.kv_publishers > 0
-        or config.obj_publishers > 0
-    ):
-        js = nc.jetstream()
-        print("JetStream context created")
+    if len(conns) == 1:
+        print("Connected to NATS")
+    else:
+        print(f"Connected to NATS ({len(conns)} connections)")
 
     # Setup stop event
     stop_event = asyncio.Event()
+    tasks: list[asyncio.Task] = []
 
-    # Handle signals
+    # Handle signals. Publishers sleep between messages rather than waiting
+    # on the stop event, so their tasks are cancelled as well.
     def signal_handler():
         print("\nShutting down...")
         stop_event.set()
+        for task in tasks:
+            task.cancel()
 
     loop = asyncio.get_event_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -484,67 +1146,31 @@ async def main(config: Config):
     # Initialize stats
     stats = Stats()
 
-    # Collect all publisher tasks
-    tasks = []
-
     print(f"Starting {total_publishers} publishers...")
 
-    # Normal publishers
-    for i in range(config.normal_publishers):
-        tasks.append(
-            asyncio.create_task(run_normal_publisher(nc, i, config, stats, stop_event))
-        )
-
-    # JetStream publishers
-    if config.js_publishers > 0:
-        await ensure_stream(js, config.js_stream_name, config.js_subject_prefix)
-        for i in range(config.js_publishers):
-            tasks.append(
-                asyncio.create_task(run_js_publisher(js, i, config, stats, stop_event))
-            )
-
-    # Request-Reply publishers
-    for i in range(config.reqrep_publishers):
-        tasks.append(
-            asyncio.create_task(run_reqrep_publisher(nc, i, config, stats, stop_event))
-        )
-
-    # KV publishers
-    if config.kv_publishers > 0:
-        kv = await ensure_kv_bucket(js, config.kv_bucket)
-        if kv:
-            for i in range(config.kv_publishers):
-                tasks.append(
-                    asyncio.create_task(
-                        run_kv_publisher(kv, i, config, stats, stop_event)
-                    )
-                )
-
-    # Object Store publishers
-    if config.obj_publishers > 0:
-        obs = await ensure_object_store(js, config.obj_bucket)
-        if obs:
-            for i in range(config.obj_publishers):
-                tasks.append(
-                    asyncio.create_task(
-                        run_obj_publisher(obs, i, config, stats, stop_event)
-                    )
-                )
+    tasks.extend(await start_publishers(conns, config, stats, stop_event))
 
     # Stats reporter
     if config.stats_interval_sec > 0:
-        tasks.append(asyncio.create_task(stats_reporter(stats, config, stop_event)))
+        tasks.append(
+            asyncio.create_task(
+                stats_reporter(stats, config, stop_event), name="stats-reporter"
+            )
+        )
 
     print("All publishers started. Press Ctrl+C to stop.")
 
     # Wait for all tasks to complete
-    await asyncio.gather(*tasks)
+    failed = await wait_for_tasks(tasks, stop_event)
 
     # Print final stats
     print_final_stats(stats)
 
-    # Close connection
-    await nc.close()
+    # Close connections
+    await close_all(conns)
+
+    if failed:
+        sys.exit(1)
 
 
 def load_config(path: str) -> Config:
@@ -563,7 +1189,8 @@ def generate_sample_config():
         kv_publishers=2,
         obj_publishers=1,
     )
-    print(json.dumps(asdict(config), indent=2))
+    data = {f.name: getattr(config, f.name) for f in fields(config)}
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
 
 
 def parse_args() -> tuple[Config, bool]:
@@ -588,6 +1215,18 @@ Examples:
         help="NATS server URL (default: nats://localhost:4222)",
     )
     parser.add_argument("--config", dest="config_file", help="Path to JSON config file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to shard publishers across (default: 1)",
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1,
+        help="NATS connections per process to spread publishers over (default: 1)",
+    )
 
     # Normal publishers
     normal = parser.add_argument_group("Normal Publishers (Core NATS)")
@@ -619,6 +1258,12 @@ Examples:
         default=1000,
         help="Publish interval in ms (default: 1000)",
     )
+    js.add_argument(
+        "--js-batch",
+        type=int,
+        default=1,
+        help="Messages published per interval before awaiting acks (default: 1)",
+    )
 
     # Request-Reply publishers
     reqrep = parser.add_argument_group("Request-Reply Publishers")
@@ -695,6 +1340,11 @@ Examples:
         default=128,
         help="Message payload size in bytes (default: 128)",
     )
+    msg.add_argument(
+        "--binary-payload",
+        action="store_true",
+        help="Encode KV payloads as MessagePack instead of JSON",
+    )
 
     # Output options
     out = parser.add_argument_group("Output Options")
@@ -703,7 +1353,7 @@ Examples:
     )
     out.add_argument(
         "--stats-interval",
-        type=int,
+        type=float,
         default=5,
         help="Stats reporting interval in seconds (default: 5, 0 to disable)",
     )
@@ -726,6 +1376,8 @@ Examples:
     else:
         config = Config(
             nats_url=args.url,
+            workers=args.workers,
+            connections=args.connections,
             normal_publishers=args.normal,
             normal_subject_prefix=args.normal_subject,
             normal_interval_ms=args.normal_interval,
@@ -733,6 +1385,7 @@ Examples:
             js_subject_prefix=args.js_subject,
             js_stream_name=args.js_stream,
             js_interval_ms=args.js_interval,
+            js_batch_size=args.js_batch,
             reqrep_publishers=args.reqrep,
             reqrep_subject_prefix=args.reqrep_subject,
             reqrep_interval_ms=args.reqrep_interval,
@@ -747,6 +1400,7 @@ Examples:
             obj_interval_ms=args.obj_interval,
             obj_size_bytes=args.obj_size,
             message_size_bytes=args.msg_size,
+            binary_payload=args.binary_payload,
             verbose=args.verbose,
             stats_interval_sec=args.stats_interval,
         )
@@ -762,6 +1416,6 @@ if __name__ == "__main__":
         sys.exit(0)
 
     try:
-        asyncio.run(main(config))
+        run_event_loop(main(config))
     except KeyboardInterrupt:
         pass